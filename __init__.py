@@ -14,15 +14,35 @@ bl_info = {
 import bpy # type: ignore
 from .components import quick_hdri, quick_output, quick_render
 
+_COMPONENTS = (quick_hdri, quick_output, quick_render)
+
+def _register_panels():
+    for component in _COMPONENTS:
+        for cls in component.panel_classes:
+            if not cls.is_registered:
+                bpy.utils.register_class(cls)
+    return None
+
+def _register_all(components):
+    for component in components:
+        component.register()
+    # Panels are only needed once the UI is drawn, so register them after startup
+    bpy.app.timers.register(_register_panels, first_interval=0.0, persistent=True)
+
+def _unregister_all(components):
+    if bpy.app.timers.is_registered(_register_panels):
+        bpy.app.timers.unregister(_register_panels)
+    for component in reversed(components):
+        for cls in reversed(component.panel_classes):
+            if cls.is_registered:
+                bpy.utils.unregister_class(cls)
+        component.unregister()
+
 def register():
-    quick_hdri.register()
-    quick_output.register()
-    quick_render.register()
+    _register_all(_COMPONENTS)
 
 def unregister():
-    quick_hdri.unregister()
-    quick_output.register()
-    quick_render.register()
+    _unregister_all(_COMPONENTS)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
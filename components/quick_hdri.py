@@ -3,11 +3,27 @@ import os
 import math
 import json
 import shutil
+import sys
+from operator import itemgetter
 
 from bpy.props import EnumProperty, FloatProperty, StringProperty, PointerProperty  # type: ignore
 from bpy.types import Operator, Panel, PropertyGroup # type: ignore
 from ..utils import load_json_asset, refresh_json_asset
 
+# Paths
+
+_ADDON_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+_HDRI_JSON = os.path.join(_ADDON_DIR, "properties", "hdri.json")
+_HDRI_ASSETS = os.path.join(_ADDON_DIR, "assets", "hdri")
+
+# World node names
+
+_MAPPING_NODE = "MU_HDRI_Mapping"
+_ENV_NODE = "MU_HDRI_Env"
+_BACKGROUND_NODE = "MU_HDRI_BG"
+
+_DEG2RAD = math.pi / 180.0
+
 # Operator Functions
 
 def setup_world_nodes(hdri_path, mapping_rotation_deg=0.0, strength=1.0):
@@ -15,15 +31,28 @@ def setup_world_nodes(hdri_path, mapping_rotation_deg=0.0, strength=1.0):
     world.use_nodes = True
     nodes = world.node_tree.nodes
     links = world.node_tree.links
+    rot_rad = mapping_rotation_deg * _DEG2RAD
+    # Same HDRI already loaded: update the parameters instead of reloading the image
+    env_tex_node = nodes.get(_ENV_NODE)
+    mapping_node = nodes.get(_MAPPING_NODE)
+    background_node = nodes.get(_BACKGROUND_NODE)
+    if (env_tex_node is not None and mapping_node is not None and background_node is not None
+            and env_tex_node.image is not None and env_tex_node.image.filepath == hdri_path):
+        mapping_node.inputs["Rotation"].default_value[2] = rot_rad
+        background_node.inputs["Strength"].default_value = strength
+        return
+    old_image = env_tex_node.image if env_tex_node is not None else None
     nodes.clear()
-    for img in list(bpy.data.images):
-        if img.filepath.lower().endswith(".exr"):
-            bpy.data.images.remove(img)
+    # Drop the previous HDRI unless something outside this world still uses it
+    if old_image is not None and old_image.users == 0:
+        bpy.data.images.remove(old_image)
     tex_coord_node = nodes.new('ShaderNodeTexCoord')
     mapping_node = nodes.new('ShaderNodeMapping')
-    # Removed fixed name assignment
+    mapping_node.name = _MAPPING_NODE
     env_tex_node = nodes.new('ShaderNodeTexEnvironment')
+    env_tex_node.name = _ENV_NODE
     background_node = nodes.new('ShaderNodeBackground')
+    background_node.name = _BACKGROUND_NODE
     world_out_node = nodes.new('ShaderNodeOutputWorld')
     tex_coord_node.location = (-800, 0)
     mapping_node.location = (-600, 0)
@@ -38,18 +67,38 @@ def setup_world_nodes(hdri_path, mapping_rotation_deg=0.0, strength=1.0):
         env_tex_node.image = bpy.data.images.load(hdri_path)
     else:
         print("HDRI file not found:", hdri_path)
-    mapping_node.inputs["Rotation"].default_value[2] = math.radians(mapping_rotation_deg)
+    mapping_node.inputs["Rotation"].default_value[2] = rot_rad
     background_node.inputs["Strength"].default_value = strength
 
+def hdri_copy_is_current(src_path, dest_path):
+    try:
+        src_stat = os.stat(src_path)
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    if os.path.samestat(src_stat, dest_stat):
+        return True
+    # shutil.copy2 preserves mtime, so an earlier copy matches on size and mtime
+    return src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
 class HDRI_OT_Apply(Operator):
     bl_idname = "hdri.apply"
     bl_label = "Apply HDRI"
     bl_description = "Apply the selected HDRI to the world environment"
 
+    @classmethod
+    def poll(cls, context):
+        props = getattr(context.scene, "hdri_props", None)
+        if props is None:
+            return False
+        if props.hdri_preset == "CUSTOM" and not props.custom_hdri_filepath:
+            cls.poll_message_set("No custom HDRI file specified.")
+            return False
+        return True
+
     def execute(self, context):
         props = context.scene.hdri_props
         hdri_file = props.hdri_preset
-        addon_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
         if hdri_file == "CUSTOM":
             custom_path = props.custom_hdri_filepath
             if not custom_path or not os.path.isfile(custom_path):
@@ -62,8 +111,7 @@ class HDRI_OT_Apply(Operator):
             setup_world_nodes(hdri_path, mapping_rotation_deg=final_mapping_deg)
             self.report({'INFO'}, f"Custom HDRI applied: {custom_path}")
             return {'FINISHED'}
-        json_path = os.path.join(os.path.dirname(__file__), "..", "properties", "hdri.json")
-        hdri_data = load_json_asset(json_path)
+        hdri_data = load_json_asset(_HDRI_JSON)
         selected = next((e for e in hdri_data if e.get("file") == hdri_file), None)
         if not selected:
             self.report({'ERROR'}, "Selected HDRI not found.")
@@ -71,7 +119,7 @@ class HDRI_OT_Apply(Operator):
         final_mapping_deg = 0
         props.hdri_base_rotation = final_mapping_deg
         props.hdri_rotation_offset = 0
-        hdri_path = os.path.join(addon_dir, "assets", "hdri", hdri_file)
+        hdri_path = os.path.join(_HDRI_ASSETS, hdri_file)
         if not os.path.isfile(hdri_path):
             self.report({'ERROR'}, f"HDRI file not found at path: {hdri_path}")
             return {'CANCELLED'}
@@ -88,6 +136,16 @@ class HDRI_OT_SavePreset(Operator):
 
     preset_name: StringProperty(name="Name", default="")  # type: ignore
 
+    @classmethod
+    def poll(cls, context):
+        props = getattr(context.scene, "hdri_props", None)
+        if props is None or props.hdri_preset != "CUSTOM":
+            return False
+        if not props.custom_hdri_filepath:
+            cls.poll_message_set("No custom HDRI file specified.")
+            return False
+        return True
+
     def invoke(self, context, event):
         props = context.scene.hdri_props
         file_name = os.path.basename(props.custom_hdri_filepath) if props.custom_hdri_filepath else ""
@@ -110,26 +168,22 @@ class HDRI_OT_SavePreset(Operator):
             self.report({'ERROR'}, "Name cannot be empty.")
             return {'CANCELLED'}
 
-        addon_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
-        assets_dir = os.path.join(addon_dir, "assets", "hdri")
-        if not os.path.isdir(assets_dir):
-            os.makedirs(assets_dir)
+        os.makedirs(_HDRI_ASSETS, exist_ok=True)
         src_path = props.custom_hdri_filepath
         dest_file = os.path.basename(src_path)
-        dest_path = os.path.join(assets_dir, dest_file)
+        dest_path = os.path.join(_HDRI_ASSETS, dest_file)
         try:
-            shutil.copy2(src_path, dest_path)
+            if not hdri_copy_is_current(src_path, dest_path):
+                shutil.copy2(src_path, dest_path)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to copy HDRI file: {e}")
             return {'CANCELLED'}
 
-        json_path = os.path.join(addon_dir, "properties", "hdri.json")
         try:
-            if os.path.isfile(json_path):
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-            else:
-                data = []
+            with open(_HDRI_JSON, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = []
         except Exception as e:
             self.report({'ERROR'}, f"Failed to load JSON: {e}")
             return {'CANCELLED'}
@@ -137,12 +191,14 @@ class HDRI_OT_SavePreset(Operator):
         new_entry = {"file": dest_file, "display_name": self.preset_name}
         data.append(new_entry)
         try:
-            with open(json_path, 'w') as f:
+            with open(_HDRI_JSON, 'w') as f:
                 json.dump(data, f, indent=4)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to save JSON: {e}")
             return {'CANCELLED'}
 
+        # Re-read even if the filesystem's mtime resolution hides the write
+        refresh_json_asset(_HDRI_JSON)
         presets = load_hdri_presets()
         valid_values = [entry.get("file", "Unknown") for entry in presets]
         valid_values.append("CUSTOM")
@@ -172,41 +228,62 @@ class HDRI_PT_Panel(Panel):
             row.prop(props, "custom_hdri_filepath")
             row.operator("hdri.save_preset", text="", icon="FILE_TICK")
         world = context.scene.world
-        mapping_found = False
-        if world and world.use_nodes:
-            for node in world.node_tree.nodes:
-                if node.type == 'MAPPING':
-                    mapping_found = True
-                    break
-        if mapping_found:
+        if world and world.use_nodes and world.node_tree.nodes.get(_MAPPING_NODE) is not None:
             layout.prop(props, "hdri_rotation_offset")
         layout.operator("hdri.apply", text="Apply HDRI")
 
 # Properties
 
+# Presets and enum items derived from the hdri.json list returned by load_json_asset
+# and the assets/hdri listing at "assets_mtime". The previous items list is kept too,
+# since Blender may still hold its strings.
+_PRESETS_CACHE = {"source": None, "assets_mtime": None, "items": None, "previous_items": None, "raw": None}
+
+_CUSTOM_ITEM = ("CUSTOM", "Custom", "Load a custom HDRI file")
+
 def load_hdri_presets():
-    json_path = os.path.join(os.path.dirname(__file__), "..", "properties", "hdri.json")
-    presets = refresh_json_asset(json_path)
-    return presets if presets is not None else []
+    source = load_json_asset(_HDRI_JSON)
+    try:
+        assets_mtime = os.stat(_HDRI_ASSETS).st_mtime_ns
+    except OSError:
+        assets_mtime = None
+    if (_PRESETS_CACHE["items"] is not None and source is _PRESETS_CACHE["source"]
+            and assets_mtime == _PRESETS_CACHE["assets_mtime"]):
+        return _PRESETS_CACHE["raw"]
+    presets = source if isinstance(source, list) else []
+    # Only offer presets whose HDRI is on disk, read with a single directory scan
+    try:
+        with os.scandir(_HDRI_ASSETS) as it:
+            existing = {e.name for e in it}
+    except FileNotFoundError:
+        existing = set()
+    presets = [entry for entry in presets if entry.get("file") in existing]
+    keyed = []
+    for entry in presets:
+        file_name = sys.intern(entry.get("file", "Unknown"))
+        display_name = sys.intern(entry.get("display_name", file_name))
+        keyed.append((display_name.lower(), (file_name, display_name, sys.intern(f"HDRI: {display_name}"))))
+    keyed.sort(key=itemgetter(0))  # sort alphabetically by display_name
+    items = [item for _, item in keyed]
+    items.append(_CUSTOM_ITEM)
+    _PRESETS_CACHE["source"] = source
+    _PRESETS_CACHE["assets_mtime"] = assets_mtime
+    _PRESETS_CACHE["previous_items"] = _PRESETS_CACHE["items"]
+    _PRESETS_CACHE["items"] = items
+    _PRESETS_CACHE["raw"] = presets
+    return presets
 
 def hdri_preset_items(self, context):
-    presets = load_hdri_presets()
-    items = []
-    if isinstance(presets, list):
-        for entry in presets:
-            file_name = entry.get("file", "Unknown")
-            display_name = entry.get("display_name", file_name)
-            items.append((file_name, display_name, f"HDRI: {display_name}"))
-    items.sort(key=lambda x: x[1].lower())  # sort alphabetically by display_name
-    items.append(("CUSTOM", "Custom", "Load a custom HDRI file"))
-    return items
+    load_hdri_presets()
+    return _PRESETS_CACHE["items"]
 
 def update_hdri_rotation_offset(self, context):
     world = context.scene.world
     if world and world.use_nodes:
-        for node in world.node_tree.nodes:
-            if node.type == 'MAPPING':
-                node.inputs["Rotation"].default_value[2] = math.radians(self.hdri_base_rotation + self.hdri_rotation_offset)
+        node = world.node_tree.nodes.get(_MAPPING_NODE)
+        if node is not None:
+            rot_rad = (self.hdri_base_rotation + self.hdri_rotation_offset) * _DEG2RAD
+            node.inputs["Rotation"].default_value[2] = rot_rad
 
 class HDRIProperties(PropertyGroup):
     hdri_preset: EnumProperty(
@@ -237,9 +314,13 @@ class HDRIProperties(PropertyGroup):
 
 # Register
 
-classes = [HDRI_OT_Apply, HDRI_OT_SavePreset, HDRI_PT_Panel, HDRIProperties]
+classes = [HDRI_OT_Apply, HDRI_OT_SavePreset, HDRIProperties]
+
+panel_classes = [HDRI_PT_Panel]
 
 def register():
+    if HDRIProperties.is_registered:
+        return
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.hdri_props = PointerProperty(type=HDRIProperties)
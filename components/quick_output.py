@@ -1,91 +1,118 @@
 import bpy  # type: ignore
 import os
-import json
-import math
-import inspect
 
-from ..utils import load_json_asset, refresh_json_asset
+from ..utils import load_json_asset
+
+# Paths
+
+_ADDON_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+_OUTPUT_JSON = os.path.join(_ADDON_DIR, "properties", "output.json")
 
 # Helper Functions
 
-def load_output_formats():
-    json_path = os.path.join(os.path.dirname(__file__), "..", "properties", "output.json")
-    formats = load_json_asset(json_path)
-    return formats if formats is not None else {}
+# Formats and enum items derived from the output.json dict returned by load_json_asset;
+# "previous_items" keeps the last list's strings alive for Blender after a reload
+_FORMATS_CACHE = {"source": None, "items": None, "previous_items": None, "raw": None}
 
-def output_preset_items(self, context):
-    formats_dict = load_output_formats()
+def load_output_formats():
+    source = load_json_asset(_OUTPUT_JSON)
+    if _FORMATS_CACHE["items"] is not None and source is _FORMATS_CACHE["source"]:
+        return _FORMATS_CACHE["raw"]
+    formats = source if isinstance(source, dict) else {}
     items = []
-    for key, data in formats_dict.items():
+    for key, data in formats.items():
         display = data.get("display_name", key)
         items.append((key, display, f"Output format: {display}"))
     if not items:
         items.append(("None", "None", "No output formats found"))
-    return items
+    _FORMATS_CACHE["source"] = source
+    _FORMATS_CACHE["previous_items"] = _FORMATS_CACHE["items"]
+    _FORMATS_CACHE["items"] = items
+    _FORMATS_CACHE["raw"] = formats
+    return formats
+
+def output_preset_items(self, context):
+    load_output_formats()
+    return _FORMATS_CACHE["items"]
+
+# EXR pass flags as (attribute, JSON pass key, panel toggle); a missing key or
+# toggle means that side does not gate the flag
+
+_EXR_VIEW_LAYER_PASSES = (
+    ("use_pass_cryptomatte_object", "cryptomatte_object", "use_cryptomatte"),
+    ("use_pass_cryptomatte_material", "cryptomatte_material", "use_cryptomatte"),
+    ("use_pass_ambient_occlusion", "ambient_occlusion", "use_ambient_occlusion"),
+)
+
+_EXR_CYCLES_PASSES = (
+    ("use_pass_shadow_catcher", None, "use_shadow_catcher"),
+    ("use_pass_denoising_data", "denoising_data", None),
+    ("denoising_store_passes", "denoising_store_passes", None),
+    ("pass_debug_sample_count", "pass_debug_sample_count", None),
+    ("use_pass_volume_direct", "volume_direct", None),
+    ("use_pass_volume_indirect", "volume_indirect", None),
+)
+
+# Passes handled by the tables above, skipped by the generic use_pass_* loop
+
+_SPECIAL_PASS_KEYS = frozenset((
+    "cryptomatte_object", "cryptomatte_material",
+    "shadow_catcher", "ambient_occlusion",
+    "denoising_data", "sample_count", "volume_direct", "volume_indirect",
+    "denoising_store_passes", "pass_debug_sample_count",
+))
+
+_MISSING = object()
+
+def apply_pass_flags(target, pass_table, passes_dict, props):
+    for attr, pass_key, toggle in pass_table:
+        if getattr(target, attr, _MISSING) is _MISSING:
+            continue
+        enabled = passes_dict.get(pass_key, False) if pass_key is not None else True
+        if toggle is not None:
+            enabled = enabled and getattr(props, toggle)
+        setattr(target, attr, enabled)
 
 def apply_exr_settings(scene, data, props, context):
-    scene.render.image_settings.color_depth = data.get("color_depth", "16")
-    scene.render.image_settings.exr_codec = data.get("exr_codec", "ZIP")
+    image_settings = scene.render.image_settings
+    image_settings.color_depth = data.get("color_depth", "16")
+    image_settings.exr_codec = data.get("exr_codec", "ZIP")
     passes_dict = data.get("passes", {})
 
     view_layer = context.view_layer
     if not view_layer:
         return False
 
-    if hasattr(view_layer, "use_pass_cryptomatte_object"):
-        view_layer.use_pass_cryptomatte_object = passes_dict.get("cryptomatte_object", False) and props.use_cryptomatte
-    if hasattr(view_layer, "use_pass_cryptomatte_material"):
-        view_layer.use_pass_cryptomatte_material = passes_dict.get("cryptomatte_material", False) and props.use_cryptomatte
-    if hasattr(view_layer, "cycles") and hasattr(view_layer.cycles, "use_pass_shadow_catcher"):
-        view_layer.cycles.use_pass_shadow_catcher = props.use_shadow_catcher
-    else:
-        print("Active view layer does not support 'shadow_catcher' pass in cycles settings.")
-    if hasattr(view_layer, "use_pass_ambient_occlusion"):
-        view_layer.use_pass_ambient_occlusion = passes_dict.get("ambient_occlusion", False) and props.use_ambient_occlusion
-    else:
-        print("Active view layer does not support 'ambient_occlusion' pass.")
-
-    if hasattr(view_layer, "cycles"):
-        if hasattr(view_layer.cycles, "use_pass_denoising_data"):
-            view_layer.cycles.use_pass_denoising_data = passes_dict.get("denoising_data", False)
-        if hasattr(view_layer.cycles, "denoising_store_passes"):
-            view_layer.cycles.denoising_store_passes = passes_dict.get("denoising_store_passes", False)
-        if hasattr(view_layer.cycles, "pass_debug_sample_count"):
-            view_layer.cycles.pass_debug_sample_count = passes_dict.get("pass_debug_sample_count", False)
-        if hasattr(view_layer.cycles, "use_pass_volume_direct"):
-            view_layer.cycles.use_pass_volume_direct = passes_dict.get("volume_direct", False)
-        if hasattr(view_layer.cycles, "use_pass_volume_indirect"):
-            view_layer.cycles.use_pass_volume_indirect = passes_dict.get("volume_indirect", False)
+    apply_pass_flags(view_layer, _EXR_VIEW_LAYER_PASSES, passes_dict, props)
+    cycles = getattr(view_layer, "cycles", None)
+    if cycles is not None:
+        apply_pass_flags(cycles, _EXR_CYCLES_PASSES, passes_dict, props)
     else:
         print("Active view layer does not have cycles settings.")
 
-    special_keys = {
-        "cryptomatte_object", "cryptomatte_material",
-        "shadow_catcher", "ambient_occlusion",
-        "denoising_data", "sample_count", "volume_direct", "volume_indirect",
-        "denoising_store_passes", "pass_debug_sample_count"
-    }
     for pass_key, pass_val in passes_dict.items():
-        if pass_key in special_keys:
+        if pass_key in _SPECIAL_PASS_KEYS:
             continue
         prop_name = "use_pass_" + pass_key
-        if hasattr(view_layer, prop_name):
+        if getattr(view_layer, prop_name, _MISSING) is not _MISSING:
             setattr(view_layer, prop_name, pass_val)
     return True
 
 def apply_png_settings(scene, data):
-    scene.render.image_settings.color_mode = data.get("color_mode", "RGBA")
-    cd = str(data.get("color_depth", 8))
-    scene.render.image_settings.color_depth = cd
-    scene.render.image_settings.compression = data.get("compression", 15)
+    image_settings = scene.render.image_settings
+    image_settings.color_mode = data.get("color_mode", "RGBA")
+    image_settings.color_depth = str(data.get("color_depth", 8))
+    image_settings.compression = data.get("compression", 15)
 
 def apply_jpeg_settings(scene, data):
-    scene.render.image_settings.color_mode = data.get("color_mode", "RGB")
-    scene.render.image_settings.quality = data.get("quality", 90)
+    image_settings = scene.render.image_settings
+    image_settings.color_mode = data.get("color_mode", "RGB")
+    image_settings.quality = data.get("quality", 90)
 
 def apply_ffmpeg_settings(scene, data):
-    scene.render.image_settings.color_mode = data.get("color_mode", "RGB")
-    scene.render.ffmpeg.format = data.get("ffmpeg_format", "MPEG4")
+    render = scene.render
+    render.image_settings.color_mode = data.get("color_mode", "RGB")
+    render.ffmpeg.format = data.get("ffmpeg_format", "MPEG4")
 
 # Operator
 
@@ -160,16 +187,17 @@ class OUTPUT_PT_PresetPanel(bpy.types.Panel):
         props = scene.output_preset_props
         layout.prop(scene.render, "filepath", text="")
         layout.prop(props, "output_preset_tag", text="Format")
-        if props.output_preset_tag == "exr":
-            row = layout.row(align=True)
-            row.label(text="\t\t\t\t\t\t\t\tShadow Catcher:")
-            row.prop(props, "use_shadow_catcher", text="")
-            row = layout.row(align=True)
-            row.label(text="\t\t\t\t\t\t\t\tAmbient Occlusion:")
-            row.prop(props, "use_ambient_occlusion", text="")
-            row = layout.row(align=True)
-            row.label(text="\t\t\t\t\t\t\t\tCryptomatte:")
-            row.prop(props, "use_cryptomatte", text="")
+        use_exr = props.output_preset_tag == "exr"
+        if use_exr:
+            split = layout.split(factor=0.6)
+            split.label(text="Shadow Catcher:")
+            split.prop(props, "use_shadow_catcher", text="")
+            split = layout.split(factor=0.6)
+            split.label(text="Ambient Occlusion:")
+            split.prop(props, "use_ambient_occlusion", text="")
+            split = layout.split(factor=0.6)
+            split.label(text="Cryptomatte:")
+            split.prop(props, "use_cryptomatte", text="")
         layout.operator("output.apply_output_preset", text="Apply Preset", icon='OUTPUT')
 
 # Registration
@@ -177,10 +205,13 @@ class OUTPUT_PT_PresetPanel(bpy.types.Panel):
 classes = [
     OUTPUT_OT_ApplyPreset,
     OutputPresetProperties,
-    OUTPUT_PT_PresetPanel,
 ]
 
+panel_classes = [OUTPUT_PT_PresetPanel]
+
 def register():
+    if OutputPresetProperties.is_registered:
+        return
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.output_preset_props = bpy.props.PointerProperty(type=OutputPresetProperties)
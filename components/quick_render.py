@@ -1,26 +1,84 @@
 import bpy  # type: ignore
 import os
-import json
 import math
 import inspect
 import shutil
+from collections import namedtuple
 
 from bpy.props import BoolProperty, PointerProperty, StringProperty
 from bpy.types import Operator, Panel, PropertyGroup, Menu
 # Use an absolute import (adjust the module path to match your add-on structure)
-from ..utils import load_json_asset, refresh_json_asset
+from ..utils import load_json_asset, save_json_asset
+
+# --- Paths ---
+
+_ADDON_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+_RENDER_JSON = os.path.join(_ADDON_DIR, "properties", "render.json")
 
 # --- Helper Functions ---
 
+# Preset values with defaults and types applied once when render.json is loaded
+RenderPresetRec = namedtuple(
+    "RenderPresetRec",
+    "display_name noise_thresh samples time render_percentage persistent_data use_tiling "
+    "filter_width transparent engine device lighting color_type show_cavity cavity_type"
+)
+
+def _upper(value):
+    return str(value).upper()
+
+def _coerce(raw, key, default, cast):
+    try:
+        return cast(raw.get(key, default))
+    except (TypeError, ValueError):
+        return cast(default)
+
+def make_render_preset_rec(raw):
+    return RenderPresetRec(
+        display_name=_coerce(raw, "display_name", "Unknown", str),
+        noise_thresh=_coerce(raw, "noise_thresh", 0.01, float),
+        samples=_coerce(raw, "samples", 512, int),
+        time=_coerce(raw, "time", 0.0, float),
+        render_percentage=_coerce(raw, "render_percentage", 1.0, float),
+        persistent_data=_coerce(raw, "persistent_data", True, bool),
+        use_tiling=_coerce(raw, "use_tiling", True, bool),
+        filter_width=_coerce(raw, "filter_width", 1.0, float),
+        transparent=_coerce(raw, "transparent", True, bool),
+        engine=_coerce(raw, "engine", "CYCLES", _upper),
+        device=_coerce(raw, "device", "GPU", str),
+        lighting=_coerce(raw, "lighting", "STUDIO", _upper),
+        color_type=_coerce(raw, "color_type", "MATERIAL", _upper),
+        show_cavity=_coerce(raw, "show_cavity", True, bool),
+        cavity_type=_coerce(raw, "cavity_type", "BOTH", _upper),
+    )
+
+# Display-name index of records and menu labels derived from the render.json list
+# returned by load_json_asset
+_PRESETS_CACHE = {"source": None, "raw": None, "index": None, "names": None}
+
 def load_render_presets():
-    json_path = os.path.join(os.path.dirname(__file__), "..", "properties", "render.json")
-    presets = load_json_asset(json_path)
-    return presets if presets is not None else []
-
-def apply_cycles_render_settings(scene, render_preset_data, props):
-    scene.cycles.adaptive_threshold = float(render_preset_data.get("noise_thresh", 0.01))
-    scene.cycles.samples = int(render_preset_data.get("samples", 512))
-    scene.cycles.time_limit = float(render_preset_data.get("time", 0.0))
+    source = load_json_asset(_RENDER_JSON)
+    if _PRESETS_CACHE["raw"] is not None and source is _PRESETS_CACHE["source"]:
+        return _PRESETS_CACHE["raw"]
+    presets = source if isinstance(source, list) else []
+    _PRESETS_CACHE["source"] = source
+    _PRESETS_CACHE["raw"] = presets
+    _PRESETS_CACHE["index"] = {p["display_name"]: make_render_preset_rec(p) for p in presets if "display_name" in p}
+    _PRESETS_CACHE["names"] = tuple(p.get("display_name", "Unknown") for p in presets)
+    return presets
+
+def get_preset_names():
+    load_render_presets()
+    return _PRESETS_CACHE["names"]
+
+def get_preset_by_name(name):
+    load_render_presets()
+    return _PRESETS_CACHE["index"].get(name)
+
+def apply_cycles_render_settings(scene, rec, props):
+    scene.cycles.adaptive_threshold = rec.noise_thresh
+    scene.cycles.samples = rec.samples
+    scene.cycles.time_limit = rec.time
     
     # Apply selected denoiser settings from the panel
     denoiser = props.denoiser_type
@@ -31,23 +89,22 @@ def apply_cycles_render_settings(scene, render_preset_data, props):
         scene.cycles.denoising_quality = props.denoiser_quality
         scene.cycles.denoising_use_gpu = props.denoiser_use_gpu
 
-    scene.render.use_persistent_data = render_preset_data.get("persistent_data", True)
-    scene.cycles.use_auto_tile = render_preset_data.get("use_tiling", True)
-    scene.cycles.filter_width = float(render_preset_data.get("filter_width", 1.0))
-    scene.render.film_transparent = render_preset_data.get("transparent", True)
+    scene.render.use_persistent_data = rec.persistent_data
+    scene.cycles.use_auto_tile = rec.use_tiling
+    scene.cycles.filter_width = rec.filter_width
+    scene.render.film_transparent = rec.transparent
 
-def apply_workbench_render_settings(scene, render_preset_data):
-    scene.render.film_transparent = render_preset_data.get("transparent", True)
+def apply_workbench_render_settings(scene, rec):
+    scene.render.film_transparent = rec.transparent
     shading = bpy.context.scene.display.shading
-    shading.light = render_preset_data.get("lighting", "STUDIO").upper()
-    shading.color_type = render_preset_data.get("color_type", "MATERIAL").upper()
-    shading.show_cavity = bool(render_preset_data.get("show_cavity", True))
-    shading.cavity_type = render_preset_data.get("cavity_type", "BOTH").upper()
+    shading.light = rec.lighting
+    shading.color_type = rec.color_type
+    shading.show_cavity = rec.show_cavity
+    shading.cavity_type = rec.cavity_type
 
-def apply_resolution_tile_settings(scene, render_preset_data, preset_engine):
-    preset_multiplier = float(render_preset_data.get("render_percentage", 1.0))
+def apply_resolution_tile_settings(scene, rec, preset_engine):
     current_percentage = scene.render.resolution_percentage or 100
-    final_res = int(current_percentage * preset_multiplier)
+    final_res = int(current_percentage * rec.render_percentage)
     scene.render.resolution_percentage = final_res
 
     width = scene.render.resolution_x
@@ -56,31 +113,31 @@ def apply_resolution_tile_settings(scene, render_preset_data, preset_engine):
         target = min(width, height)
     else:
         target = max(width, height)
-    tile_size = 2 ** round(math.log(target, 2))
+    # Nearest power of two in log scale: round up once target exceeds lo * sqrt(2)
+    lo = 1 << (int(target).bit_length() - 1)
+    tile_size = lo << 1 if target * target > 2 * lo * lo else lo
     if preset_engine == "CYCLES":
-        scene.cycles.tile_size = int(tile_size)
+        scene.cycles.tile_size = tile_size
 
-def preset_differs(scene, preset_data):
+def preset_differs(scene, rec):
     """Return True if the current scene settings (excluding denoiser settings) differ from the preset."""
-    s = scene
-    diff = False
-    if abs(s.cycles.adaptive_threshold - float(preset_data.get("noise_thresh", 0.01))) > 1e-6:
-        diff = True
-    elif s.cycles.samples != int(preset_data.get("samples", 512)):
-        diff = True
-    elif abs(s.cycles.time_limit - float(preset_data.get("time", 0.0))) > 1e-6:
-        diff = True
-    elif abs((s.render.resolution_percentage or 100) - int(float(preset_data.get("render_percentage", 1.0)) * 100)) > 1e-6:
-        diff = True
-    elif s.render.use_persistent_data != preset_data.get("persistent_data", True):
-        diff = True
-    elif s.cycles.use_auto_tile != preset_data.get("use_tiling", True):
-        diff = True
-    elif abs(s.cycles.filter_width - float(preset_data.get("filter_width", 1.0))) > 1e-6:
-        diff = True
-    elif s.render.film_transparent != preset_data.get("transparent", True):
-        diff = True
-    return diff
+    cyc = scene.cycles
+    rnd = scene.render
+    if not math.isclose(cyc.adaptive_threshold, rec.noise_thresh, rel_tol=0, abs_tol=1e-6):
+        return True
+    if cyc.samples != rec.samples:
+        return True
+    if not math.isclose(cyc.time_limit, rec.time, rel_tol=0, abs_tol=1e-6):
+        return True
+    if (rnd.resolution_percentage or 100) != int(rec.render_percentage * 100):
+        return True
+    if rnd.use_persistent_data != rec.persistent_data:
+        return True
+    if cyc.use_auto_tile != rec.use_tiling:
+        return True
+    if not math.isclose(cyc.filter_width, rec.filter_width, rel_tol=0, abs_tol=1e-6):
+        return True
+    return rnd.film_transparent != rec.transparent
 
 # --- Operator to Apply Render Preset ---
 
@@ -92,18 +149,13 @@ class RENDER_OT_apply_render_preset(bpy.types.Operator):
     def execute(self, context):
         scene = context.scene
         props = scene.render_preset_props
-        render_presets = load_render_presets()
-        render_preset_data = None
         # Use the stored preset name (display name) to lookup the preset
-        for p in render_presets:
-            if p.get("display_name") == props.render_preset_tag:
-                render_preset_data = p
-                break
+        render_preset_data = get_preset_by_name(props.render_preset_tag)
         if render_preset_data is None:
             self.report({'WARNING'}, f"No render preset found for preset: {props.render_preset_tag}")
             return {'CANCELLED'}
 
-        preset_engine = render_preset_data.get("engine", "CYCLES").upper()
+        preset_engine = render_preset_data.engine
         scene.render.engine = preset_engine
 
         if preset_engine == "CYCLES":
@@ -135,11 +187,9 @@ class RENDER_MT_render_preset_menu(bpy.types.Menu):
 
     def draw(self, context):
         layout = self.layout
-        presets = load_render_presets()
-        for preset in presets:
-            value = preset.get("display_name", "Unknown")
-            op = layout.operator("render.select_render_preset", text=value)
-            op.preset_value = value
+        for name in get_preset_names():
+            op = layout.operator("render.select_render_preset", text=name)
+            op.preset_value = name
 
 # --- Operator to Save Render Preset ---
 
@@ -173,31 +223,26 @@ class RENDER_OT_save_render_preset(bpy.types.Operator):
             "filter_width": scene.cycles.filter_width,
             "transparent": scene.render.film_transparent
         }
-        addon_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
-        json_path = os.path.join(addon_dir, "properties", "render.json")
-        try:
-            if os.path.isfile(json_path):
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-            else:
-                data = []
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to load JSON: {e}")
+        json_path = _RENDER_JSON
+        # Reuse the cached presets instead of parsing render.json again
+        if not isinstance(load_json_asset(json_path), list) and os.path.exists(json_path):
+            self.report({'ERROR'}, f"Failed to load JSON: {json_path}")
             return {'CANCELLED'}
+        data = list(load_render_presets())
         data.append(new_entry)
         try:
-            with open(json_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            save_json_asset(json_path, data)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to save JSON: {e}")
             return {'CANCELLED'}
 
-        refresh_json_asset(json_path)
         scene.render_preset_props.render_preset_tag = new_entry["display_name"]
         # Force redraw of all Properties areas so the menu refreshes immediately.
-        for area in bpy.context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        screen = context.screen
+        if screen is not None:
+            for area in screen.areas:
+                if area.type == 'PROPERTIES':
+                    area.tag_redraw()
         self.report({'INFO'}, f"Render Preset saved: {self.preset_name}")
         return {'FINISHED'}
 
@@ -250,15 +295,12 @@ class RENDER_PT_RenderPresetPanel(bpy.types.Panel):
         scene = context.scene
         props = scene.render_preset_props
 
+        tag = props.render_preset_tag
         row = layout.row(align=True)
-        row.menu("RENDER_MT_render_preset_menu", text=(props.render_preset_tag or "Select Preset"))
+        row.menu("RENDER_MT_render_preset_menu", text=(tag or "Select Preset"))
         # Only show denoiser options if the selected preset uses Cycles.
-        preset_data = None
-        for p in load_render_presets():
-            if p.get("display_name") == props.render_preset_tag:
-                preset_data = p
-                break
-        if preset_data and preset_data.get("engine", "").upper() == "CYCLES":
+        preset_data = get_preset_by_name(tag) if tag else None
+        if preset_data is not None and preset_data.engine == "CYCLES":
             layout.prop(props, "denoiser_type")
             if props.denoiser_type == "OPENIMAGEDENOISE":
                 layout.prop(props, "denoiser_quality")
@@ -275,10 +317,13 @@ classes = [
     RENDER_OT_select_render_preset,
     RenderPresetProperties,
     RENDER_MT_render_preset_menu,
-    RENDER_PT_RenderPresetPanel,
 ]
 
+panel_classes = [RENDER_PT_RenderPresetPanel]
+
 def register():
+    if RenderPresetProperties.is_registered:
+        return
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.render_preset_props = bpy.props.PointerProperty(type=RenderPresetProperties)
@@ -3,32 +3,60 @@ import os
 import json
 from typing import Union
 
-__all__ = ["load_json_asset", "refresh_json_asset"]
+# Prefer orjson when it is installed in Blender's Python, fall back to stdlib json
 
-# Global cache for JSON assets
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+__all__ = ["load_json_asset", "refresh_json_asset", "save_json_asset"]
+
+# Global cache for JSON assets, keyed by resolved path and holding (st_mtime_ns, data).
+# A missing or unparsable file is cached as well, so it is not retried until it changes.
 
 _json_cache = {}
 
 # JSON file loader helper function
 
+def _resolve(filename: str) -> str:
+    if not os.path.isabs(filename):
+        filename = os.path.join(os.path.dirname(__file__), "assets", filename)
+    return os.path.normcase(os.path.abspath(filename))
+
 def load_json_asset(filename: str) -> Union[dict, list, None]:
-    if filename in _json_cache:
-        return _json_cache[filename]
-    if os.path.isabs(filename):
-        json_path = filename
-    else:
-        addon_dir = os.path.dirname(__file__)
-        json_path = os.path.join(addon_dir, "assets", filename)
+    json_path = _resolve(filename)
     try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-            _json_cache[filename] = data
-            return data
+        mtime = os.stat(json_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _json_cache.get(json_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = None
+    try:
+        with open(json_path, "rb") as f:
+            data = _loads(f.read())
     except Exception as e:
         print(f"Error loading {filename}: {e}")
-        return None
+    _json_cache[json_path] = (mtime, data)
+    return data
     
 def refresh_json_asset(filename: str) -> Union[dict, list, None]:
-    if filename in _json_cache:
-        del _json_cache[filename]
-    return load_json_asset(filename)
\ No newline at end of file
+    _json_cache.pop(_resolve(filename), None)
+    return load_json_asset(filename)
+
+def save_json_asset(filename: str, data: Union[dict, list]) -> None:
+    json_path = _resolve(filename)
+    tmp_path = json_path + ".tmp"
+    # Write to a temporary file and swap it in, so a failed write keeps the old file
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, json_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _json_cache[json_path] = (os.stat(json_path).st_mtime_ns, data)
\ No newline at end of file